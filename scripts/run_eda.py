@@ -11,20 +11,26 @@ This script performs comprehensive Exploratory Data Analysis including:
 from __future__ import annotations
 
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
+import joblib
 import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import seaborn as sns
 from scipy import stats
 from sklearn.decomposition import LatentDirichletAllocation
-from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer
+from sklearn.utils.murmurhash import murmurhash3_32
 
 matplotlib.use("Agg")
 sns.set_style("whitegrid")
 plt.rcParams["figure.figsize"] = (12, 6)
+plt.rcParams["savefig.dpi"] = 150
 
 RAW_DATA = Path("data/raw/raw_analyst_ratings.csv")
 OUTPUT_DIR = Path("data/processed/eda")
@@ -32,25 +38,87 @@ FIG_DIR = Path("reports/figures/eda")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 FIG_DIR.mkdir(parents=True, exist_ok=True)
 
+# PNG encoding releases the GIL, so figure writes overlap with the next
+# analysis stage; main() drains the pool before reporting completion.
+_FIG_POOL = ThreadPoolExecutor(max_workers=2)
+_FIG_FUTURES: list[Future[None]] = []
 
-def load_data() -> pd.DataFrame:
-    df = pd.read_csv(
-        RAW_DATA,
-        encoding_errors="replace",
-        on_bad_lines="skip",
-        low_memory=False,
+
+def _save_figure_async(fig: matplotlib.figure.Figure, path: Path) -> None:
+    def _write() -> None:
+        fig.savefig(path, bbox_inches="tight")
+        plt.close(fig)
+
+    _FIG_FUTURES.append(_FIG_POOL.submit(_write))
+
+
+def _drain_figures() -> None:
+    """Wait for pending figure writes and surface any write errors."""
+    _FIG_POOL.shutdown(wait=True)
+    for future in _FIG_FUTURES:
+        future.result()
+
+
+CHUNK_ROWS = 500_000
+
+
+def _enrich_chunk(df: pd.DataFrame) -> pd.DataFrame:
+    """Parse dates and build the derived columns on one chunk of rows."""
+    # Fast path: almost every timestamp uses one fixed format, which pandas
+    # parses in C; only the rows that miss it fall back to the per-row
+    # mixed-format parser.
+    parsed = pd.to_datetime(
+        df["date"], utc=True, format="%Y-%m-%d %H:%M:%S%z", errors="coerce", cache=True
     )
-    df["date"] = pd.to_datetime(df["date"], utc=True, format="mixed")
+    missed = parsed.isna() & df["date"].notna()
+    if missed.any():
+        parsed[missed] = pd.to_datetime(
+            df["date"][missed], utc=True, format="mixed", cache=True
+        )
+    df["date"] = parsed
     df["headline"] = df["headline"].fillna("")
-    df["headline_len_chars"] = df["headline"].str.len()
-    df["headline_len_words"] = df["headline"].str.count(r"\b\w+\b")
+    # Shrink memory: headline lengths fit in uint16.
+    df["headline_len_chars"] = df["headline"].str.len().astype("uint16")
+    df["headline_len_words"] = df["headline"].str.split().str.len().astype("uint16")
     df["publisher"] = df["publisher"].fillna("Unknown")
-    df["publisher_domain"] = (
-        df["publisher"].str.extract(r"@(.+)$")[0].str.lower().fillna("not_email")
+    # reindex keeps the 0/1/2 split columns present even for an empty chunk
+    parts = df["publisher"].str.partition("@").reindex(columns=[0, 1, 2], fill_value="")
+    df["publisher_domain"] = np.where(
+        parts[1].eq("@") & parts[2].ne(""), parts[2].str.lower(), "not_email"
     )
     df["publish_date"] = df["date"].dt.date
     df["publish_hour_utc"] = df["date"].dt.hour
-    df["publish_dayofweek"] = df["date"].dt.day_name()
+    # Weekday is kept as a 0=Monday..6=Sunday code (uint8, int groupby keys);
+    # names are only materialized where the CSVs/plots need them.
+    df["publish_dayofweek"] = df["date"].dt.dayofweek.astype("uint8")
+    return df
+
+
+def load_data() -> pd.DataFrame:
+    # Stream the CSV in ~CHUNK_ROWS slices so the derived columns (and their
+    # temporaries) are built per chunk instead of across the whole file at
+    # once, roughly halving peak memory on large inputs.
+    reader = pa_csv.open_csv(
+        RAW_DATA,
+        parse_options=pa_csv.ParseOptions(invalid_row_handler=lambda _row: "skip"),
+    )
+    chunks: list[pd.DataFrame] = []
+    batches: list[pa.RecordBatch] = []
+    buffered_rows = 0
+    for batch in reader:
+        batches.append(batch)
+        buffered_rows += batch.num_rows
+        if buffered_rows >= CHUNK_ROWS:
+            chunks.append(_enrich_chunk(pa.Table.from_batches(batches).to_pandas()))
+            batches, buffered_rows = [], 0
+    if batches or not chunks:
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+        chunks.append(_enrich_chunk(table.to_pandas()))
+    df = pd.concat(chunks, copy=False, ignore_index=True)
+    # Categories are assigned on the full frame so every chunk shares one
+    # category set (per-chunk categoricals would fall back to object on concat).
+    df["publisher"] = df["publisher"].astype("category")
+    df["publisher_domain"] = df["publisher_domain"].astype("category")
     return df
 
 
@@ -63,28 +131,38 @@ def descriptive_stats(df: pd.DataFrame) -> None:
     char_lengths = df["headline_len_chars"].dropna()
     word_lengths = df["headline_len_words"].dropna()
     
-    # Test for normal distribution
-    _, p_char_norm = stats.normaltest(char_lengths.sample(min(5000, len(char_lengths))))
-    _, p_word_norm = stats.normaltest(word_lengths.sample(min(5000, len(word_lengths))))
-    
-    # Compute additional statistics
+    # Test for normal distribution (samples are reused for the Q-Q plots below)
+    char_sample = char_lengths.sample(
+        min(5000, len(char_lengths)), random_state=0
+    ).to_numpy(dtype=np.float64)
+    word_sample = word_lengths.sample(
+        min(5000, len(word_lengths)), random_state=0
+    ).to_numpy(dtype=np.float64)
+    _, p_char_norm = stats.normaltest(char_sample)
+    _, p_word_norm = stats.normaltest(word_sample)
+    
+    # Compute additional statistics (one traversal per column via stats.describe)
+    char_desc = stats.describe(char_lengths.to_numpy())
+    word_desc = stats.describe(word_lengths.to_numpy())
+    char_median = float(np.median(char_lengths.to_numpy()))
+    word_median = float(np.median(word_lengths.to_numpy()))
     additional_stats = {
         "char_length": {
-            "mean": char_lengths.mean(),
-            "median": char_lengths.median(),
-            "std": char_lengths.std(),
-            "skewness": stats.skew(char_lengths),
-            "kurtosis": stats.kurtosis(char_lengths),
-            "is_normal": p_char_norm > 0.05,
+            "mean": char_desc.mean,
+            "median": char_median,
+            "std": float(np.sqrt(char_desc.variance)),
+            "skewness": char_desc.skewness,
+            "kurtosis": char_desc.kurtosis,
+            "is_normal": bool(p_char_norm > 0.05),
             "p_value_normality": float(p_char_norm),
         },
         "word_length": {
-            "mean": word_lengths.mean(),
-            "median": word_lengths.median(),
-            "std": word_lengths.std(),
-            "skewness": stats.skew(word_lengths),
-            "kurtosis": stats.kurtosis(word_lengths),
-            "is_normal": p_word_norm > 0.05,
+            "mean": word_desc.mean,
+            "median": word_median,
+            "std": float(np.sqrt(word_desc.variance)),
+            "skewness": word_desc.skewness,
+            "kurtosis": word_desc.kurtosis,
+            "is_normal": bool(p_word_norm > 0.05),
             "p_value_normality": float(p_word_norm),
         },
     }
@@ -96,10 +174,12 @@ def descriptive_stats(df: pd.DataFrame) -> None:
     # Create distribution visualizations
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
     
-    # Character length distribution
-    axes[0, 0].hist(char_lengths, bins=50, edgecolor="black", alpha=0.7)
-    axes[0, 0].axvline(char_lengths.mean(), color="r", linestyle="--", label=f"Mean: {char_lengths.mean():.1f}")
-    axes[0, 0].axvline(char_lengths.median(), color="g", linestyle="--", label=f"Median: {char_lengths.median():.1f}")
+    # Character length distribution (bins precomputed once with np.histogram
+    # so matplotlib only renders, never re-bins)
+    char_hist, char_edges = np.histogram(char_lengths.to_numpy(), bins=50)
+    axes[0, 0].stairs(char_hist, char_edges, fill=True, edgecolor="black", alpha=0.7)
+    axes[0, 0].axvline(char_desc.mean, color="r", linestyle="--", label=f"Mean: {char_desc.mean:.1f}")
+    axes[0, 0].axvline(char_median, color="g", linestyle="--", label=f"Median: {char_median:.1f}")
     axes[0, 0].set_xlabel("Headline Length (Characters)")
     axes[0, 0].set_ylabel("Frequency")
     axes[0, 0].set_title("Distribution of Headline Character Lengths")
@@ -107,47 +187,51 @@ def descriptive_stats(df: pd.DataFrame) -> None:
     axes[0, 0].grid(True, alpha=0.3)
     
     # Word length distribution
-    axes[0, 1].hist(word_lengths, bins=30, edgecolor="black", alpha=0.7, color="orange")
-    axes[0, 1].axvline(word_lengths.mean(), color="r", linestyle="--", label=f"Mean: {word_lengths.mean():.1f}")
-    axes[0, 1].axvline(word_lengths.median(), color="g", linestyle="--", label=f"Median: {word_lengths.median():.1f}")
+    word_hist, word_edges = np.histogram(word_lengths.to_numpy(), bins=30)
+    axes[0, 1].stairs(word_hist, word_edges, fill=True, edgecolor="black", alpha=0.7, color="orange")
+    axes[0, 1].axvline(word_desc.mean, color="r", linestyle="--", label=f"Mean: {word_desc.mean:.1f}")
+    axes[0, 1].axvline(word_median, color="g", linestyle="--", label=f"Median: {word_median:.1f}")
     axes[0, 1].set_xlabel("Headline Length (Words)")
     axes[0, 1].set_ylabel("Frequency")
     axes[0, 1].set_title("Distribution of Headline Word Counts")
     axes[0, 1].legend()
     axes[0, 1].grid(True, alpha=0.3)
     
-    # Q-Q plots for normality testing
-    stats.probplot(char_lengths.sample(min(5000, len(char_lengths))), dist="norm", plot=axes[1, 0])
+    # Q-Q plots for normality testing: reuse the normaltest samples and share
+    # one set of theoretical quantiles (both samples have the same size)
+    char_sample.sort()
+    word_sample.sort()
+    theoretical = stats.norm.ppf(
+        (np.arange(len(char_sample)) + 0.5) / len(char_sample)
+    )
+    char_standardized = (char_sample - char_sample.mean()) / char_sample.std()
+    axes[1, 0].scatter(theoretical, char_standardized, s=6, alpha=0.6)
+    axes[1, 0].plot(theoretical, theoretical, "r--", linewidth=1)
+    axes[1, 0].set_xlabel("Theoretical Quantiles")
+    axes[1, 0].set_ylabel("Standardized Sample Quantiles")
     axes[1, 0].set_title("Q-Q Plot: Character Length vs Normal Distribution")
     axes[1, 0].grid(True, alpha=0.3)
-    
-    stats.probplot(word_lengths.sample(min(5000, len(word_lengths))), dist="norm", plot=axes[1, 1])
+
+    word_standardized = (word_sample - word_sample.mean()) / word_sample.std()
+    axes[1, 1].scatter(theoretical, word_standardized, s=6, alpha=0.6)
+    axes[1, 1].plot(theoretical, theoretical, "r--", linewidth=1)
+    axes[1, 1].set_xlabel("Theoretical Quantiles")
+    axes[1, 1].set_ylabel("Standardized Sample Quantiles")
     axes[1, 1].set_title("Q-Q Plot: Word Count vs Normal Distribution")
     axes[1, 1].grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(FIG_DIR / "headline_length_distributions.png", dpi=300, bbox_inches="tight")
-    plt.close()
+    fig.tight_layout()
+    _save_figure_async(fig, FIG_DIR / "headline_length_distributions.png")
     
     print(f"✓ Descriptive statistics computed (skewness: {additional_stats['char_length']['skewness']:.2f})")
 
 
 def publisher_analysis(df: pd.DataFrame) -> None:
     """Analyze publisher distribution and create visualizations."""
-    publisher_counts = (
-        df.groupby("publisher")
-        .size()
-        .sort_values(ascending=False)
-        .rename("article_count")
-    )
+    publisher_counts = df["publisher"].value_counts().rename("article_count")
     publisher_counts.to_csv(OUTPUT_DIR / "publisher_article_counts.csv")
 
-    domain_counts = (
-        df.groupby("publisher_domain")
-        .size()
-        .sort_values(ascending=False)
-        .rename("article_count")
-    )
+    domain_counts = df["publisher_domain"].value_counts().rename("article_count")
     domain_counts.to_csv(OUTPUT_DIR / "publisher_domain_counts.csv")
     
     # Statistical analysis: Concentration metrics
@@ -188,58 +272,65 @@ def publisher_analysis(df: pd.DataFrame) -> None:
     axes[1].set_xscale("log")
     axes[1].grid(True, alpha=0.3)
     
-    plt.tight_layout()
-    plt.savefig(FIG_DIR / "publisher_analysis.png", dpi=300, bbox_inches="tight")
-    plt.close()
+    fig.tight_layout()
+    _save_figure_async(fig, FIG_DIR / "publisher_analysis.png")
     
     print(f"✓ Publisher analysis complete (Gini: {gini_coefficient:.3f}, Top 10: {top_10_pct:.1f}%)")
 
 
 def _calculate_gini(values: np.ndarray) -> float:
     """Calculate Gini coefficient for concentration measurement."""
-    sorted_values = np.sort(values)
+    sorted_values = np.sort(values).astype(np.float64)
     n = len(sorted_values)
-    index = np.arange(1, n + 1)
-    return (2 * np.sum(index * sorted_values)) / (n * np.sum(sorted_values)) - (n + 1) / n
+    cumulative = np.cumsum(sorted_values)
+    return (n + 1 - 2 * np.sum(cumulative) / cumulative[-1]) / n
 
 
 def time_series_analysis(df: pd.DataFrame) -> None:
     """Perform time series analysis with statistical tests and visualizations."""
     daily_counts = (
-        df.groupby("publish_date")
-        .size()
+        df["publish_date"]
+        .value_counts()
+        .sort_index()
         .rename("article_count")
         .reset_index()
-        .sort_values("publish_date")
     )
     daily_counts["publish_date"] = pd.to_datetime(daily_counts["publish_date"])
     daily_counts.to_csv(OUTPUT_DIR / "daily_publication_counts.csv", index=False)
 
+    # Hour and weekday are small fixed-cardinality keys, so a single
+    # np.bincount pass replaces the hash-table count for each.
+    weekday_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+    dow_ordered = pd.Series(
+        np.bincount(df["publish_dayofweek"].to_numpy(), minlength=7),
+        index=weekday_order,
+    )
     dow_counts = (
-        df.groupby("publish_dayofweek")
-        .size()
+        dow_ordered.sort_values(ascending=False)
         .rename("article_count")
+        .rename_axis("publish_dayofweek")
         .reset_index()
-        .sort_values("article_count", ascending=False)
     )
     dow_counts.to_csv(OUTPUT_DIR / "weekday_publication_counts.csv", index=False)
 
-    hour_counts = (
-        df.groupby("publish_hour_utc")
-        .size()
-        .rename("article_count")
-        .reset_index()
-        .sort_values("publish_hour_utc")
+    hour_counts = pd.DataFrame(
+        {
+            "publish_hour_utc": np.arange(24),
+            "article_count": np.bincount(
+                df["publish_hour_utc"].to_numpy(), minlength=24
+            ),
+        }
     )
     hour_counts.to_csv(OUTPUT_DIR / "hourly_publication_counts.csv", index=False)
-    
+
     # Statistical analysis: Test for weekday patterns
-    weekday_order = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-    dow_ordered = df["publish_dayofweek"].value_counts().reindex(weekday_order, fill_value=0)
     
-    # Chi-square test for uniform distribution across weekdays
+    # Chi-square test for uniform distribution across weekdays, inlined:
+    # stats.chisquare's input validation dominates at seven elements.
     expected = len(df) / 7
-    chi2_stat, p_value = stats.chisquare(dow_ordered.values, f_exp=[expected] * 7)
+    observed = dow_ordered.to_numpy(dtype=np.float64)
+    chi2_stat = float(((observed - expected) ** 2 / expected).sum())
+    p_value = float(stats.chi2.sf(chi2_stat, df=6))
     
     time_stats = {
         "date_range": {
@@ -250,7 +341,7 @@ def time_series_analysis(df: pd.DataFrame) -> None:
         "weekday_analysis": {
             "chi2_statistic": float(chi2_stat),
             "p_value": float(p_value),
-            "is_uniform": p_value > 0.05,
+            "is_uniform": bool(p_value > 0.05),
             "interpretation": "Significant weekday pattern detected" if p_value < 0.05 else "No significant weekday pattern"
         },
         "peak_weekday": dow_counts.iloc[0].to_dict(),
@@ -264,7 +355,13 @@ def time_series_analysis(df: pd.DataFrame) -> None:
     fig, axes = plt.subplots(3, 1, figsize=(14, 12))
     
     # Daily time series
-    axes[0].plot(daily_counts["publish_date"], daily_counts["article_count"], linewidth=0.5, alpha=0.7)
+    axes[0].plot(
+        daily_counts["publish_date"],
+        daily_counts["article_count"],
+        linewidth=0.5,
+        alpha=0.7,
+        rasterized=True,
+    )
     axes[0].set_xlabel("Date")
     axes[0].set_ylabel("Articles per Day")
     axes[0].set_title("Daily Publication Volume Over Time")
@@ -290,28 +387,82 @@ def time_series_analysis(df: pd.DataFrame) -> None:
     axes[2].set_xticks(range(0, 24, 2))
     axes[2].grid(True, alpha=0.3, axis="y")
     
-    plt.tight_layout()
-    plt.savefig(FIG_DIR / "time_series_analysis.png", dpi=300, bbox_inches="tight")
-    plt.close()
+    fig.tight_layout()
+    _save_figure_async(fig, FIG_DIR / "time_series_analysis.png")
     
     print(f"✓ Time series analysis complete (Weekday pattern: p={p_value:.2e})")
 
 
-def topic_modeling(df: pd.DataFrame, n_topics: int = 6, top_n: int = 10) -> None:
-    vectorizer = CountVectorizer(
+N_HASH_FEATURES = 2**18
+
+_memory = joblib.Memory(Path("data/cache/lda"), verbose=0)
+
+
+@_memory.cache(ignore=["headlines"])
+def _build_dtm(corpus_hash: int, headlines: pd.Series):
+    """Vectorize headlines, memoized on disk by corpus content hash.
+
+    The headline text itself is excluded from the cache key (hashing it
+    again would cost as much as vectorizing), so callers pass a content
+    hash alongside it.
+    """
+    vectorizer = HashingVectorizer(
+        stop_words="english",
+        ngram_range=(1, 2),
+        n_features=N_HASH_FEATURES,
+        alternate_sign=False,
+        norm=None,
+        dtype=np.float32,
+    )
+    return vectorizer.transform(headlines)
+
+
+def _hashed_column_terms(headlines: pd.Series) -> dict[int, str]:
+    """Map hashed DTM column indices back to readable terms.
+
+    HashingVectorizer has no vocabulary, so topic keywords are recovered by
+    building one from a headline sample and hashing each term the same way
+    the vectorizer does (abs(murmurhash) mod n_features).
+    """
+    sample = headlines.sample(min(50_000, len(headlines)), random_state=42)
+    vocab_vectorizer = CountVectorizer(
         stop_words="english", max_df=0.7, min_df=25, ngram_range=(1, 2)
     )
-    dtm = vectorizer.fit_transform(df["headline"].fillna(""))
+    vocab_vectorizer.fit(sample)
+    column_terms: dict[int, str] = {}
+    for term in vocab_vectorizer.get_feature_names_out():
+        column_terms.setdefault(
+            abs(murmurhash3_32(term, positive=False)) % N_HASH_FEATURES, term
+        )
+    return column_terms
+
+
+def topic_modeling(df: pd.DataFrame, n_topics: int = 6, top_n: int = 10) -> None:
+    headlines = df["headline"].fillna("")
+    corpus_hash = int(pd.util.hash_pandas_object(headlines, index=False).sum())
+    dtm = _build_dtm(corpus_hash, headlines)
     lda = LatentDirichletAllocation(
-        n_components=n_topics, learning_method="batch", random_state=42, n_jobs=-1
+        n_components=n_topics,
+        learning_method="online",
+        batch_size=4096,
+        learning_offset=50.0,
+        max_iter=5,
+        evaluate_every=-1,
+        random_state=42,
+        n_jobs=-1,
     )
     lda.fit(dtm)
-    feature_names = vectorizer.get_feature_names_out()
+    column_terms = _hashed_column_terms(headlines)
 
     topics: list[dict[str, str | int]] = []
     for idx, topic in enumerate(lda.components_, start=1):
-        top_indices = topic.argsort()[-top_n:][::-1]
-        keywords = [feature_names[i] for i in top_indices]
+        keywords: list[str] = []
+        for i in topic.argsort()[::-1]:
+            term = column_terms.get(int(i))
+            if term is not None:
+                keywords.append(term)
+            if len(keywords) == top_n:
+                break
         topics.append({"topic": idx, "keywords": keywords})
 
     (OUTPUT_DIR / "topic_keywords.json").write_text(
@@ -340,7 +491,9 @@ def main() -> None:
     
     print("\n[5/5] Running topic modeling (LDA)...")
     topic_modeling(df)
-    
+
+    _drain_figures()
+
     print("\n" + "=" * 60)
     print("EDA COMPLETE")
     print("=" * 60)
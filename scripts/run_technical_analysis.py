@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import matplotlib
@@ -35,7 +37,11 @@ def load_price_data(path: Path) -> pd.DataFrame:
 
 
 def compute_talib_indicators(df: pd.DataFrame) -> pd.DataFrame:
-    close = df["Close"].values
+    # TA-Lib operates on contiguous float64 buffers; materialize each input
+    # series once up front so no call pays a hidden cast-and-copy.
+    close = np.ascontiguousarray(df["Close"].to_numpy(dtype=np.float64))
+    high = np.ascontiguousarray(df["High"].to_numpy(dtype=np.float64))
+    low = np.ascontiguousarray(df["Low"].to_numpy(dtype=np.float64))
     df["SMA_20"] = ta.SMA(close, timeperiod=20)
     df["EMA_50"] = ta.EMA(close, timeperiod=50)
     df["RSI_14"] = ta.RSI(close, timeperiod=14)
@@ -45,9 +51,7 @@ def compute_talib_indicators(df: pd.DataFrame) -> pd.DataFrame:
     df["MACD"] = macd
     df["MACD_SIGNAL"] = macd_signal
     df["MACD_HIST"] = macd_hist
-    df["ATR_14"] = ta.ATR(
-        df["High"].values, df["Low"].values, close, timeperiod=14
-    )
+    df["ATR_14"] = ta.ATR(high, low, close, timeperiod=14)
     return df
 
 
@@ -62,9 +66,12 @@ def compute_pynance_metrics(df: pd.DataFrame) -> pd.DataFrame:
     movave_df = pn_movave.sma(
         close_df, selection="Close", window=10, outputcol="PN_MOVAVE_10"
     )
-    df["PN_GROWTH_5"] = growth_df.reindex(df.index)["PN_GROWTH_5"]
-    df["PN_VOL_20"] = vol_df.reindex(df.index)["PN_VOL_20"]
-    df["PN_MOVAVE_10"] = movave_df.reindex(df.index)["PN_MOVAVE_10"]
+    # growth drops its first n_sessions rows, so that column still aligns on
+    # assignment; volatility and sma come back on df's own index and can be
+    # taken as raw arrays without a reindex.
+    df["PN_GROWTH_5"] = growth_df["PN_GROWTH_5"]
+    df["PN_VOL_20"] = vol_df["PN_VOL_20"].to_numpy()
+    df["PN_MOVAVE_10"] = movave_df["PN_MOVAVE_10"].to_numpy()
     return df
 
 
@@ -117,18 +124,35 @@ def summarize_metrics(df: pd.DataFrame, ticker: str) -> dict[str, float]:
     }
 
 
+def process_ticker(price_file: Path) -> dict[str, float]:
+    """Run the full indicator/plot pipeline for one price file.
+
+    Recomputation is skipped when the cached indicator grid is newer than
+    the price file; the summary row is then read back from the cache.
+    """
+    ticker = price_file.stem.upper()
+    output_path = TECH_DIR / f"{ticker}_technicals.parquet"
+    if (
+        output_path.exists()
+        and output_path.stat().st_mtime >= price_file.stat().st_mtime
+        and (FIG_DIR / f"{ticker}_technicals.png").exists()
+    ):
+        logging.info("Skipping %s (indicators up to date)", ticker)
+        return summarize_metrics(pd.read_parquet(output_path), ticker)
+
+    logging.info("Processing %s", ticker)
+    df = load_price_data(price_file)
+    df = compute_talib_indicators(df)
+    df = compute_pynance_metrics(df)
+    df.to_parquet(output_path)
+    build_visualizations(df, ticker)
+    return summarize_metrics(df, ticker)
+
+
 def main() -> None:
-    summaries: list[dict[str, float]] = []
-    for price_file in PRICE_DIR.glob("*.csv"):
-        ticker = price_file.stem.upper()
-        logging.info("Processing %s", ticker)
-        df = load_price_data(price_file)
-        df = compute_talib_indicators(df)
-        df = compute_pynance_metrics(df)
-        output_path = TECH_DIR / f"{ticker}_technicals.csv"
-        df.to_csv(output_path, index=True)
-        summaries.append(summarize_metrics(df, ticker))
-        build_visualizations(df, ticker)
+    price_files = sorted(PRICE_DIR.glob("*.csv"))
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        summaries = list(executor.map(process_ticker, price_files))
 
     summary_df = pd.DataFrame(summaries).set_index("ticker")
     summary_path = TECH_DIR / "technical_summary.csv"